@@ -0,0 +1,167 @@
+import time
+import unicodedata
+
+import pytest
+
+import windows_personal_command_assistant as assistant
+
+
+@pytest.fixture(params=["rapidfuzz", "pure-python"])
+def registry(request, monkeypatch):
+    if request.param == "rapidfuzz":
+        if assistant.Levenshtein is None:
+            pytest.skip("rapidfuzz is not installed")
+    else:
+        monkeypatch.setattr(assistant, "Levenshtein", None)
+    return assistant.CommandRegistry()
+
+
+@pytest.mark.parametrize(
+    "user_input, expected",
+    [
+        ("제어판 열어줘", "open_control_panel"),
+        # With several triggers in one input the earliest registered action
+        # wins, wherever its trigger appears.
+        ("크롬 켜줘 그리고 제어판 열어줘", "open_control_panel"),
+        ("제어판 열어줘 그리고 크롬 켜줘", "open_control_panel"),
+        ("유튜브 열어줘 그리고 네이버 열어줘", "open_naver"),
+        ("네트워크 설정 열어줘", "open_settings"),
+        ("CHROME", "open_chrome"),
+        ("  YouTube 틀어줘", "open_youtube"),
+        ("뭐야", None),
+    ],
+)
+def test_resolve(user_input, expected):
+    action = assistant.CommandRegistry().resolve(user_input)
+    assert (action.name if action else None) == expected
+
+
+def test_resolve_after_register():
+    registry = assistant.CommandRegistry()
+    assert registry.resolve("계산기 열어줘") is None  # builds the pattern
+    registry.register(
+        assistant.CommandAction(
+            name="open_calculator",
+            description="계산기를 엽니다.",
+            triggers=("계산기 열어줘", "chrome"),
+            handler=lambda: "",
+        )
+    )
+    assert registry.resolve("계산기 열어줘").name == "open_calculator"
+    assert registry.resolve("나중에 계산기 열어줘").name == "open_calculator"
+    # A shared trigger stays with the earlier action, and earlier actions still win.
+    assert registry.resolve("chrome").name == "open_chrome"
+    assert registry.resolve("계산기 열어줘 chrome").name == "open_chrome"
+    assert registry.resolve("계산기 열어줘 그리고 제어판 열어줘").name == "open_control_panel"
+
+
+@pytest.mark.parametrize(
+    "user_input, expected",
+    [
+        # Typos of a real trigger.
+        ("제어판 열어주", "open_control_panel"),
+        ("유투브 열어줘", "open_youtube"),
+        ("크롬 캬줘", "open_chrome"),
+        ("다운로드 폴도 열어줘", "open_downloads"),
+        ("settngs", "open_settings"),
+        ("chrom", "open_chrome"),
+        # Different words or unrelated commands must not run anything.
+        # Swapping a whole syllable flips the meaning ("꺼줘" = turn off).
+        ("크롬 꺼줘", None),
+        ("제어판 꺼줘", None),
+        ("유튜브 꺼줘", None),
+        ("메모장 열어줘", None),
+        ("계산기 열어줘", None),
+        ("폴더 열어줘", None),
+        ("사진 폴더 열어줘", None),
+        ("문서 폴더 닫아줘", None),
+        ("유튜브 뮤직 켜줘", None),
+        ("열어줘", None),
+        ("켜줘", None),
+        ("home", None),
+    ],
+)
+def test_resolve_fuzzy(registry, user_input, expected):
+    action = registry.resolve_fuzzy(user_input)
+    assert (action.name if action else None) == expected
+
+
+def test_nfd_input_matches_nfc_triggers(registry):
+    user_input = unicodedata.normalize("NFD", "제어판 열어줘")
+    assert registry.resolve(user_input).name == registry.resolve_fuzzy(user_input).name == "open_control_panel"
+
+
+@pytest.mark.parametrize(
+    "user_input, expected",
+    [
+        ("https://langchain.com", "https://langchain.com"),
+        ("https://a.org 사이트", "https://a.org"),
+        ("http://a.b/c d", "http://a.b/c"),
+        ("http://localhost:8000 열어줘", "http://localhost:8000"),
+        ("HTTP://x.com 열어줘", "HTTP://x.com"),
+        ("열어줘 HTTP://x.com", "HTTP://x.com"),
+        ("google.com/search?q=x", "https://google.com/search?q=x"),
+        ("naver.com에 들어가줘", "https://naver.com"),
+        ("naver.com.", "https://naver.com"),
+        ("naver.co.kr", "https://naver.co.kr"),
+        ("example.com.au", "https://example.com.au"),
+        ("shop.naver.com.kr/event 열어줘", "https://shop.naver.com.kr/event"),
+        ("langchain 사이트", "https://langchain"),
+        ("네이버 웹사이트", "https://네이버"),
+        ("네이버 웹 사이트", "https://네이버"),
+        ("네이버 웹 사이트 열어줘", "https://네이버"),
+        ("웹사이트", None),
+        ("웹 사이트", None),
+        ("다음사이트", None),
+        ("google.company", None),
+    ],
+)
+def test_maybe_open_website(monkeypatch, user_input, expected):
+    opened = []
+    monkeypatch.setattr(assistant, "_open_url", opened.append)
+    result = assistant.CommandProcessor()._maybe_open_website(user_input)
+    assert opened == ([expected] if expected else [])
+    assert (result is None) == (expected is None)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("a.com." * 3, "https://a.com.a.com.a.com"),
+        ("열어줘 naver.com, 부탁해", "https://naver.com"),
+        ("(naver.com)", "https://naver.com"),
+        (".com", None),
+        ("google.com/?u=http://x", "https://google.com/?u=http://x"),
+        ("ftp://x.com", None),
+        ("a.com.!", None),
+    ],
+)
+def test_find_domain(text, expected):
+    assert assistant._find_domain(text) == expected
+
+
+def _best_time(text, repeat=5):
+    processor = assistant.CommandProcessor()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        processor._maybe_open_website(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize(
+    "make_input",
+    [
+        lambda n: "a.com." * n,
+        lambda n: "a." * n + "!",
+        lambda n: "com." * n + "!",
+        lambda n: "a" * n,
+        lambda n: ("x" * n + " ") * 4,
+        lambda n: "웹 " * n,
+    ],
+)
+def test_maybe_open_website_scales_linearly(monkeypatch, make_input):
+    monkeypatch.setattr(assistant, "_open_url", lambda url: None)
+    # A linear scan takes ~4x as long on 4x the input; a quadratic one ~16x.
+    assert _best_time(make_input(8_000)) < 10 * _best_time(make_input(2_000))
@@ -9,21 +9,79 @@
 from __future__ import annotations
 
 import os
-import subprocess
+import re
 import sys
-import webbrowser
-from dataclasses import dataclass
+import threading
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Callable, List, Optional, Sequence, Tuple
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+from unicodedata import normalize
+
+if TYPE_CHECKING:
+    import tkinter
 
 try:
-    import tkinter as tk
-    from tkinter import ttk
-except Exception as exc:  # pragma: no cover - Tkinter import errors are runtime issues.
-    raise RuntimeError("Tkinter is required to run the assistant GUI.") from exc
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # pragma: no cover - optional C++ edit distance.
+    Levenshtein = None
 
 
 IS_WINDOWS = os.name == "nt"
+# Maximum total edit distance (in Hangul jamo) for a typo-tolerant trigger
+# match; each word may differ by at most one jamo.
+FUZZY_MAX_EDITS = 2
+# The result area keeps at most this many lines; the oldest half is dropped first.
+MAX_RESULT_LINES = 200
+
+# Website detection: a leading http(s) URL is opened as typed. Otherwise the first
+# whitespace token with a known domain suffix (see `_find_domain`) is used.
+_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+_DOMAIN_SUFFIXES = frozenset({"com", "net", "org"})
+_DOMAIN_LABEL_RE = re.compile(r"[A-Za-z0-9-]+")
+# "<name> 사이트" / "<name> 웹사이트" / "<name> 웹 사이트" phrasing; a standalone
+# "웹" is never taken as the name. Matches start only at a token boundary, and
+# the lazy name cannot cross whitespace, so each token is scanned once.
+_SITE_RE = re.compile(r"(?!웹(?:\s|사이트))(?<!\S)(\S+?)(?:\s+웹)?(?:\s+웹?|웹)사이트")
+
+# Per-thread DP rows reused by `CommandRegistry._bounded_edit`.
+_edit_rows = threading.local()
+
+
+# `subprocess`, `webbrowser` and Tkinter are imported on first use so that
+# start-up (and headless reuse of the processor) does not pay for them.
+@lru_cache(maxsize=1)
+def _sp() -> ModuleType:
+    import subprocess
+
+    return subprocess
+
+
+@lru_cache(maxsize=1)
+def _wb() -> ModuleType:
+    import webbrowser
+
+    return webbrowser
+
+
+@lru_cache(maxsize=1)
+def _tk() -> ModuleType:
+    try:
+        import tkinter
+    except Exception as exc:  # pragma: no cover - Tkinter import errors are runtime issues.
+        raise RuntimeError("Tkinter is required to run the assistant GUI.") from exc
+    return tkinter
+
+
+@lru_cache(maxsize=1)
+def _ttk() -> ModuleType:
+    _tk()
+    from tkinter import ttk
+
+    return ttk
 
 
 def _ensure_windows() -> None:
@@ -33,13 +91,63 @@ def _ensure_windows() -> None:
 
 def _launch_process(command: Sequence[str]) -> None:
     _ensure_windows()
-    subprocess.Popen(command, shell=False)
+    _sp().Popen(command, shell=False)
 
 
-def _start_via_cmd(target: str) -> None:
-    "Use the Windows `start` command to launch apps, settings, or URLs."
+def _shell_open(target: str) -> None:
+    "Open apps, settings URIs, or URLs through ShellExecute without a `cmd.exe` child."
     _ensure_windows()
-    subprocess.Popen(["cmd", "/c", "start", "", target], shell=False)
+    os.startfile(target)  # type: ignore[attr-defined]
+
+
+def _open_url(url: str) -> None:
+    _wb().open(url)
+
+
+def _has_domain_suffix(labels: Sequence[str]) -> bool:
+    "Return True if a label after the first is com/net/org or the pair co.kr."
+    # Labels from `valid_from` on are all plain ASCII labels, so each suffix
+    # position is checked in constant time.
+    valid_from = len(labels)
+    while valid_from > 1 and _DOMAIN_LABEL_RE.fullmatch(labels[valid_from - 1]):
+        valid_from -= 1
+    for i in range(1, len(labels)):
+        if i == 1 and not labels[0]:
+            continue
+        label = labels[i].lower()
+        if label in _DOMAIN_SUFFIXES:
+            end = i + 1
+        elif label == "co" and i + 1 < len(labels) and labels[i + 1].lower() == "kr":
+            end = i + 2
+        else:
+            continue
+        if end >= valid_from:
+            return True
+    return False
+
+
+def _find_domain(text: str) -> Optional[str]:
+    """Return a URL for the first token that looks like a domain, or None.
+
+    Surrounding ``(`` / ``.,)`` punctuation is ignored, and so is a Hangul
+    particle right after a bare domain ("naver.com에"). Each token is split and
+    scanned a constant number of times, so the cost is linear in the input length.
+    """
+    for token in text.split():
+        token = token.lstrip("(").rstrip(".,)")
+        scheme, sep, rest = token.partition("://")
+        if not sep or scheme.lower() not in ("http", "https"):
+            scheme, sep, rest = "https", "://", token
+        cut = next((i for i, ch in enumerate(rest) if ch in "/?#:"), len(rest))
+        host, path = rest[:cut], rest[cut:]
+        if not path:
+            end = len(host)
+            while end and (host[end - 1] in ".,)" or "가" <= host[end - 1] <= "힣"):
+                end -= 1
+            host = host[:end]
+        if _has_domain_suffix(host.split(".")):
+            return f"{scheme}{sep}{host}{path}"
+    return None
 
 
 def _open_folder(path: Path) -> None:
@@ -49,12 +157,18 @@ def _open_folder(path: Path) -> None:
     os.startfile(path)  # type: ignore[attr-defined]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandAction:
     name: str
     description: str
     triggers: Tuple[str, ...]
     handler: Callable[[], str]
+    _lower_triggers: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Lowercase and NFC-normalize once here so `resolve` never case-folds
+        # triggers per call and matches decomposed (NFD) Hangul input.
+        object.__setattr__(self, "_lower_triggers", tuple(normalize("NFC", t.lower()) for t in self.triggers))
 
 
 class CommandRegistry:
@@ -62,6 +176,11 @@ class CommandRegistry:
 
     def __init__(self) -> None:
         self._actions: List[CommandAction] = []
+        self._alt_re: Optional[re.Pattern[str]] = None
+        self._trigger_rank: Dict[str, int] = {}
+        self._trigger_index: Dict[str, CommandAction] = {}
+        # Trigger words decomposed (NFD) into Hangul jamo for typo-tolerant matching.
+        self._fuzzy_index: Dict[Tuple[str, ...], CommandAction] = {}
         self._register_defaults()
 
     def _register_defaults(self) -> None:
@@ -74,7 +193,7 @@ class CommandRegistry:
                 name="open_control_panel",
                 description="제어판을 실행합니다.",
                 triggers=("제어판 열어줘", "제어판 켜줘", "control panel"),
-                handler=lambda: self._wrap_action(_launch_process, ["control"], "제어판을 열었습니다."),
+                handler=self._make_handler(_launch_process, ["control"], "제어판을 열었습니다."),
             )
         )
 
@@ -83,7 +202,7 @@ class CommandRegistry:
                 name="open_chrome",
                 description="Google Chrome 브라우저를 실행합니다.",
                 triggers=("크롬 켜줘", "크롬 열어줘", "chrome"),
-                handler=lambda: self._wrap_action(_start_via_cmd, "chrome", "크롬을 실행했습니다."),
+                handler=self._make_handler(_shell_open, "chrome", "크롬을 실행했습니다."),
             )
         )
 
@@ -92,7 +211,7 @@ class CommandRegistry:
                 name="open_downloads",
                 description="다운로드 폴더를 엽니다.",
                 triggers=("다운로드 폴더 열어줘", "다운로드 열어줘"),
-                handler=lambda: self._wrap_action(_open_folder, downloads, "다운로드 폴더를 열었습니다."),
+                handler=self._make_handler(_open_folder, downloads, "다운로드 폴더를 열었습니다."),
             )
         )
 
@@ -101,7 +220,7 @@ class CommandRegistry:
                 name="open_documents",
                 description="문서 폴더를 엽니다.",
                 triggers=("문서 폴더 열어줘", "문서 열어줘"),
-                handler=lambda: self._wrap_action(_open_folder, documents, "문서 폴더를 열었습니다."),
+                handler=self._make_handler(_open_folder, documents, "문서 폴더를 열었습니다."),
             )
         )
 
@@ -110,7 +229,7 @@ class CommandRegistry:
                 name="open_desktop",
                 description="바탕화면 폴더를 엽니다.",
                 triggers=("바탕화면 열어줘", "바탕화면 폴더"),
-                handler=lambda: self._wrap_action(_open_folder, desktop, "바탕화면을 열었습니다."),
+                handler=self._make_handler(_open_folder, desktop, "바탕화면을 열었습니다."),
             )
         )
 
@@ -119,7 +238,7 @@ class CommandRegistry:
                 name="open_settings",
                 description="Windows 설정 앱을 엽니다.",
                 triggers=("설정 열어줘", "설정 켜줘", "settings"),
-                handler=lambda: self._wrap_action(_start_via_cmd, "ms-settings:", "Windows 설정을 열었습니다."),
+                handler=self._make_handler(_shell_open, "ms-settings:", "Windows 설정을 열었습니다."),
             )
         )
 
@@ -128,8 +247,8 @@ class CommandRegistry:
                 name="open_network_settings",
                 description="네트워크 설정 화면을 엽니다.",
                 triggers=("네트워크 설정", "와이파이 설정"),
-                handler=lambda: self._wrap_action(
-                    _start_via_cmd, "ms-settings:network-status", "네트워크 설정을 열었습니다."
+                handler=self._make_handler(
+                    _shell_open, "ms-settings:network-status", "네트워크 설정을 열었습니다."
                 ),
             )
         )
@@ -139,7 +258,7 @@ class CommandRegistry:
                 name="open_naver",
                 description="네이버 홈페이지를 엽니다.",
                 triggers=("네이버 열어줘", "네이버 켜줘"),
-                handler=lambda: self._wrap_action(webbrowser.open, "https://www.naver.com", "네이버를 열었습니다."),
+                handler=self._make_handler(_open_url, "https://www.naver.com", "네이버를 열었습니다."),
             )
         )
 
@@ -148,28 +267,139 @@ class CommandRegistry:
                 name="open_youtube",
                 description="유튜브를 엽니다.",
                 triggers=("유튜브 열어줘", "유튜브 켜줘", "youtube"),
-                handler=lambda: self._wrap_action(webbrowser.open, "https://www.youtube.com", "유튜브를 열었습니다."),
+                handler=self._make_handler(_open_url, "https://www.youtube.com", "유튜브를 열었습니다."),
             )
         )
 
+    @staticmethod
+    def _make_handler(func: Callable[..., object], arg: object, success_message: str) -> Callable[[], str]:
+        "Bind `func(arg)` and its success message into a single zero-argument handler."
+
+        def handler() -> str:
+            func(arg)
+            return success_message
+
+        return handler
+
     def register(self, action: CommandAction) -> None:
         self._actions.append(action)
+        for trigger in action._lower_triggers:
+            # The earliest registered action keeps a shared trigger.
+            self._trigger_index.setdefault(trigger, action)
+            self._fuzzy_index.setdefault(tuple(normalize("NFD", trigger).split()), action)
+        # The substring pattern is rebuilt lazily on the next `resolve` call.
+        self._alt_re = None
+        self.__dict__.pop("help_body", None)
+
+    @cached_property
+    def help_body(self) -> str:
+        "One `• triggers → description` line per registered command."
+        return "\n".join(f"• {' / '.join(action.triggers)} → {action.description}" for action in self._actions)
+
+    def _build_alt_re(self) -> re.Pattern[str]:
+        "Compile every trigger, in registration order, into one overlapping alternation."
+        triggers = [trigger for trigger in self._trigger_index if trigger]
+        self._trigger_rank = {trigger: rank for rank, trigger in enumerate(triggers)}
+        # The lookahead reports a match at every start position, and at each one
+        # the alternation picks the earliest registered trigger.
+        return re.compile("(?=(" + "|".join(map(re.escape, triggers)) + "))")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _normalize(text: str) -> str:
-        return text.strip().lower()
+        # IMEs and clipboards may hand over NFD Hangul; compare in NFC like the triggers.
+        return normalize("NFC", text.strip().lower())
 
     def resolve(self, user_input: str) -> Optional[CommandAction]:
         normalized = self._normalize(user_input)
-        for action in self._actions:
-            for trigger in action.triggers:
-                if trigger.lower() in normalized:
-                    return action
-        return None
+        # Users mostly type a trigger verbatim, which a single dict lookup answers.
+        exact = self._trigger_index.get(normalized)
+        if exact is not None:
+            return exact
+        if self._alt_re is None:
+            self._alt_re = self._build_alt_re()
+        if not self._trigger_rank:
+            return None
+        # Several triggers may occur in one input; the earliest registered wins.
+        matches = (match.group(1) for match in self._alt_re.finditer(normalized))
+        best = min(matches, key=self._trigger_rank.__getitem__, default=None)
+        return self._trigger_index[best] if best is not None else None
+
+    def resolve_fuzzy(self, user_input: str) -> Optional[CommandAction]:
+        "Return the action whose trigger is closest to the input, tolerating typos."
+        # Compare word by word over Hangul jamo: "열어주" is one edit from
+        # "열어줘", but swapping a whole syllable ("꺼줘" for "켜줘") costs two
+        # and is rejected. RapidFuzz only speeds up the per-word distance; both
+        # backends apply the same bound.
+        words = normalize("NFD", self._normalize(user_input)).split()
+        best: Optional[CommandAction] = None
+        best_distance = FUZZY_MAX_EDITS + 1
+        for trigger_words, action in self._fuzzy_index.items():
+            if len(trigger_words) != len(words):
+                continue
+            total = 0
+            for word, trigger_word in zip(words, trigger_words):
+                distance = self._word_edit(word, trigger_word)
+                total += distance
+                if distance > 1 or total >= best_distance:
+                    break
+            else:
+                best, best_distance = action, total
+        return best
+
+    @classmethod
+    def _word_edit(cls, word: str, trigger_word: str) -> int:
+        "Jamo edit distance between two words, or 2 once it exceeds the one-edit budget."
+        if word == trigger_word:
+            return 0
+        if abs(len(word) - len(trigger_word)) > 1:
+            return 2
+        if Levenshtein is not None:
+            return Levenshtein.distance(word, trigger_word, score_cutoff=1)
+        return cls._bounded_edit(word, trigger_word, 1)
 
-    def _wrap_action(self, func: Callable, *args, success_message: str) -> str:
-        func(*args)
-        return success_message
+    @staticmethod
+    def _bounded_edit(a: str, b: str, k: int) -> int:
+        """Levenshtein distance between `a` and `b`, or `k + 1` once it exceeds `k`.
+
+        Uses two rolling rows sized to the shorter string and only fills the
+        diagonal band of width `2k + 1`, so the cost is O(k * len(a)).
+        """
+        if len(a) < len(b):
+            a, b = b, a
+        n, m = len(a), len(b)
+        if n - m > k:
+            return k + 1
+        rows = getattr(_edit_rows, "rows", None)
+        if rows is None or len(rows[0]) <= m:
+            rows = _edit_rows.rows = (array("i", [0]) * (m + 1), array("i", [0]) * (m + 1))
+        prev, curr = rows
+        limit = k + 1
+        for j in range(min(m, k) + 1):
+            prev[j] = j
+        if k < m:
+            prev[k + 1] = limit
+        for i in range(1, n + 1):
+            lo = max(1, i - k)
+            hi = min(m, i + k)
+            curr[lo - 1] = i if lo == 1 else limit
+            row_min = curr[lo - 1]
+            char = a[i - 1]
+            for j in range(lo, hi + 1):
+                value = prev[j - 1] + (char != b[j - 1])
+                if prev[j] + 1 < value:
+                    value = prev[j] + 1
+                if curr[j - 1] + 1 < value:
+                    value = curr[j - 1] + 1
+                curr[j] = value
+                if value < row_min:
+                    row_min = value
+            if row_min > k:
+                return limit
+            if hi < m:
+                curr[hi + 1] = limit
+            prev, curr = curr, prev
+        return min(prev[m], limit)
 
 
 class CommandProcessor:
@@ -183,7 +413,7 @@ class CommandProcessor:
         if not cleaned:
             return "명령어를 입력해 주세요."
 
-        action = self.registry.resolve(cleaned)
+        action = self.registry.resolve(cleaned) or self.registry.resolve_fuzzy(cleaned)
         if action:
             try:
                 return action.handler()
@@ -197,32 +427,28 @@ class CommandProcessor:
         return self._help_message(cleaned)
 
     def _maybe_open_website(self, text: str) -> Optional[str]:
-        lowered = text.lower()
-        if lowered.startswith("http://") or lowered.startswith("https://"):
-            webbrowser.open(text)
-            return f"🌐 웹사이트를 열었습니다: {text}"
-        if " 사이트" in text or "웹사이트" in text:
-            parts = text.replace("사이트", "").replace("웹", "").split()
-            if parts:
-                query = parts[0]
-                url = f"https://{query}"
-                webbrowser.open(url)
-                return f"🌐 추정한 주소({url})를 열었습니다."
-        if any(domain in lowered for domain in (".com", ".net", ".org", ".co.kr")):
-            url = text if text.startswith("http") else f"https://{text}"
-            webbrowser.open(url)
+        url_match = _URL_RE.match(text)
+        if url_match:
+            url = url_match.group()
+            _open_url(url)
+            return f"🌐 웹사이트를 열었습니다: {url}"
+        site_match = _SITE_RE.search(text)
+        if site_match:
+            url = f"https://{site_match.group(1)}"
+            _open_url(url)
+            return f"🌐 추정한 주소({url})를 열었습니다."
+        url = _find_domain(text)
+        if url:
+            _open_url(url)
             return f"🌐 웹사이트를 열었습니다: {url}"
         return None
 
     def _help_message(self, user_input: str) -> str:
-        commands = "\n".join(
-            f"• {' / '.join(action.triggers)} → {action.description}" for action in self.registry._actions
-        )
         lines = [
             f"알 수 없는 명령입니다: '{user_input}'.",
             "",
             "예시 명령어:",
-            commands,
+            self.registry.help_body,
             "",
             "웹사이트 주소(예: https://example.com)를 직접 입력하면 브라우저로 열 수 있습니다.",
         ]
@@ -232,15 +458,23 @@ class CommandProcessor:
 class CommandAssistantApp:
     "Tkinter GUI that captures user commands and shows results."
 
-    def __init__(self, root: tk.Tk, processor: Optional[CommandProcessor] = None) -> None:
+    def __init__(self, root: tkinter.Tk, processor: Optional[CommandProcessor] = None) -> None:
         self.root = root
         self.processor = processor or CommandProcessor()
         self.root.title("개인 명령 실행 비서")
         self.root.geometry("640x420")
         self.root.resizable(False, False)
+        # Commands run on one persistent worker so slow process creation never
+        # blocks the Tk main loop; results are marshaled back via `root.after`.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="command")
+        self._busy = False
+        self._closed = False
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self._build_widgets()
 
     def _build_widgets(self) -> None:
+        tk = _tk()
+        ttk = _ttk()
         main_frame = ttk.Frame(self.root, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -253,7 +487,8 @@ class CommandAssistantApp:
 
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X)
-        ttk.Button(button_frame, text="실행", command=self.execute_command).pack(side=tk.LEFT)
+        self.run_button = ttk.Button(button_frame, text="실행", command=self.execute_command)
+        self.run_button.pack(side=tk.LEFT)
         ttk.Button(button_frame, text="지우기", command=self.clear_output).pack(side=tk.LEFT, padx=8)
 
         ttk.Label(main_frame, text="실행 결과").pack(anchor=tk.W, pady=(16, 0))
@@ -264,18 +499,55 @@ class CommandAssistantApp:
         ttk.Button(button_frame, text="(미래) 음성 입력", state=tk.DISABLED).pack(side=tk.RIGHT)
 
     def execute_command(self) -> None:
+        # One command at a time: Enter is gated like the disabled "실행" button,
+        # and the typed text stays in the entry until the worker is free.
+        if self._busy:
+            return
+        tk = _tk()
         user_input = self.command_var.get()
-        result = self.processor.process(user_input)
-        self._append_result(result)
         self.command_var.set("")
+        self._busy = True
+        self.run_button.configure(state=tk.DISABLED)
+        future = self._executor.submit(self.processor.process, user_input)
+        future.add_done_callback(self._schedule_finish)
+
+    def _schedule_finish(self, future: Future) -> None:
+        "Runs on the worker thread; hands the result to the Tk thread unless the window is gone."
+        if self._closed:
+            return
+        try:
+            self.root.after(0, self._finish_command, future)
+        except (RuntimeError, _tk().TclError):
+            # The window was destroyed between the check and the call.
+            pass
+
+    def _finish_command(self, future: Future) -> None:
+        tk = _tk()
+        self._busy = False
+        self.run_button.configure(state=tk.NORMAL)
+        try:
+            result = future.result()
+        except Exception as exc:  # pragma: no cover - runtime error reporting.
+            result = f"❌ 명령 처리 중 오류가 발생했습니다: {exc}"
+        self._append_result(result)
 
     def clear_output(self) -> None:
+        tk = _tk()
         self.result_area.configure(state=tk.NORMAL)
         self.result_area.delete("1.0", tk.END)
         self.result_area.configure(state=tk.DISABLED)
 
+    def _on_close(self) -> None:
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def _append_result(self, text: str) -> None:
+        tk = _tk()
         self.result_area.configure(state=tk.NORMAL)
+        lines = int(self.result_area.index("end-1c").split(".")[0])
+        if lines > MAX_RESULT_LINES:
+            self.result_area.delete("1.0", f"{MAX_RESULT_LINES // 2 + 1}.0")
         self.result_area.insert(tk.END, text + "\n\n")
         self.result_area.configure(state=tk.DISABLED)
         self.result_area.see(tk.END)
@@ -286,7 +558,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if not IS_WINDOWS:
         print("⚠️  이 프로그램은 Windows 11 전용입니다. 일부 명령은 다른 OS에서 동작하지 않습니다.")
 
-    root = tk.Tk()
+    root = _tk().Tk()
     app = CommandAssistantApp(root)
     root.mainloop()
     return 0